@@ -5,11 +5,9 @@ import asyncio
 vector_db = VectorDB()
 
 async def match_skills(jd_struct: list, resume_struct: list) -> list:
-    matches = {}
-    for skill in jd_struct:
-        found = await vector_db.similarity_search(skill, resume_struct, top_k=1)
-        matches[skill] = found[0] if found else None
-    return [result for result in matches.values() if result is not None]
+    jd_skills = list(dict.fromkeys(jd_struct))
+    found = await vector_db.batch_match(jd_skills, resume_struct)
+    return [result for result in found if result is not None]
 
 
 # jd_skills_testing = ['python', 'langchain', 'haystack', 
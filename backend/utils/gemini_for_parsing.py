@@ -1,31 +1,100 @@
 from google import genai
 from dotenv import load_dotenv
-from pypdf import PdfReader
 import asyncio
+import hashlib
 import re
+import weakref
+from functools import lru_cache
 
 load_dotenv()
 
 
-# reader = PdfReader("test pdfs/Jay Singh Resume AI-ML-DS.pdf")
-# text_all = ""
-# for page in reader.pages:
-#     text_all+=page.extract_text()
+@lru_cache(maxsize=1)
+def get_client():
+    # The client gets the API key from the environment variable `GEMINI_API_KEY`.
+    # Built on first use so importing this module stays cheap.
+    return genai.Client()
 
+# Caps in-flight Gemini requests to stay inside the API rate limits. A semaphore is bound to
+# the loop it is first awaited on, so each running loop gets its own
+_GEMINI_CONCURRENCY = 8
+_gemini_semaphores = weakref.WeakKeyDictionary()
 
-# The client gets the API key from the environment variable `GEMINI_API_KEY`.
-client = genai.Client()
+def _gemini_semaphore():
+    loop = asyncio.get_running_loop()
+    semaphore = _gemini_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _gemini_semaphores[loop] = asyncio.Semaphore(_GEMINI_CONCURRENCY)
+    return semaphore
 
 async def gemini_client(prompt):
-    response = client.models.generate_content(
-        model="models/gemini-2.5-flash-lite-preview-06-17", contents=prompt
-    )
+    async with _gemini_semaphore():
+        response = await get_client().aio.models.generate_content(
+            model="models/gemini-2.5-flash-lite-preview-06-17", contents=prompt
+        )
     return response.text
 
 
-# text_all = text_all.replace("\n", " ").strip()
+# A skills section heading on a line of its own, e.g. "Technical Skills:"
+_SKILLS_HEADING_RE = re.compile(r'^[ \t]*(?:technical[ \t]+)?skills[ \t]*:?[ \t]*$', re.I | re.M)
+# Headings that close the skills section; extracted PDF text rarely keeps blank lines between sections
+_NEXT_SECTION_RE = re.compile(
+    r'^[ \t]*(?:(?:work|professional)[ \t]+)?(?:experience|education|projects|certifications?|achievements|'
+    r'awards|publications|summary|objective|interests|languages)[ \t]*:?[ \t]*$',
+    re.I | re.M,
+)
+_SKILL_ITEM_SPLIT_RE = re.compile(r'[,;|•\n]')
+
+@lru_cache(maxsize=1)
+def get_local_parser():
+    # Imported on first use: utils.resume_parser pulls in spaCy and dateutil
+    from utils.resume_parser import AccurateResumeParser
+    return AccurateResumeParser()
+
+def _skills_section_items(resume_text):
+    """Items listed under the skills heading, or [] when there is no single unambiguous one"""
+    headings = list(_SKILLS_HEADING_RE.finditer(resume_text))
+    if len(headings) != 1:
+        return []
+    section = resume_text[headings[0].end():].split('\n\n', 1)[0]
+    next_heading = _NEXT_SECTION_RE.search(section)
+    if next_heading:
+        section = section[:next_heading.start()]
+    items = []
+    for line in section.split('\n'):
+        # Drop a "Languages:" style category label in front of the items
+        for item in _SKILL_ITEM_SPLIT_RE.split(line.split(':', 1)[-1]):
+            item = item.strip(' \t-*').lower()
+            if item:
+                items.append(item)
+    return items
+
+# Parsed skills keyed by a digest of the resume text, so a repeat resume never hits the model
+_RESUME_CACHE_SIZE = 1024
+_resume_skills_cache = {}
 
 async def resume_parser(resume_text):
+    key = hashlib.blake2b(resume_text.encode('utf-8')).hexdigest()
+    if key in _resume_skills_cache:
+        return list(_resume_skills_cache[key])
+
+    # The local vocabulary is small, so Gemini is skipped only when it covers every
+    # item of the skills section; the section items are then the answer as-is
+    # The first call imports spaCy and dateutil, so keep it off the event loop
+    local_parser = await asyncio.to_thread(get_local_parser)
+    section_items = _skills_section_items(resume_text)
+    if section_items and all(item in local_parser.technical_skills for item in section_items):
+        skills = list(dict.fromkeys(section_items))
+    else:
+        skills = await _gemini_resume_skills(resume_text)
+
+    if len(_resume_skills_cache) >= _RESUME_CACHE_SIZE:
+        _resume_skills_cache.pop(next(iter(_resume_skills_cache)))
+    _resume_skills_cache[key] = skills
+    return list(skills)
+
+
+async def _gemini_resume_skills(resume_text):
     
     
     prompt = f"""
@@ -103,6 +172,11 @@ async def resume_parser(resume_text):
     # print(ans)
     
 
+async def parse_many(resume_texts: list) -> list:
+    """Parse several resumes concurrently; a failed resume yields its exception instead of a skill list"""
+    return await asyncio.gather(*[resume_parser(text) for text in resume_texts], return_exceptions=True)
+
+
 async def jd_parser(jd_text: str):
 
     # resume_text = text_all.replace("\n", " ").strip()
@@ -168,7 +242,8 @@ async def jd_parser(jd_text: str):
     # print(ans)    
 
 
-jobdescrip = """
+if __name__ == "__main__":
+    jobdescrip = """
                 About the job
 
                 Job Title: LLM Engineer
@@ -217,6 +292,4 @@ jobdescrip = """
 
             """
 
-
-# asyncio.run(jd_parser(jobdescrip))
-
+    print(asyncio.run(jd_parser(jobdescrip)))
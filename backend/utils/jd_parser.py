@@ -184,25 +184,40 @@ def _extract_candidates(text: str) -> List[str]:
 
 import re
 from typing import List, Set, Dict
-import spacy
 from collections import defaultdict
+from utils.nlp_utils import load_nlp, compile_vocab_re
+
+# Skills matched verbatim before any pattern or NLP extraction
+_KNOWN_SKILLS = frozenset({
+    'python', 'java', 'javascript', 'react', 'angular', 'vue.js', 'node.js',
+    'mysql', 'postgresql', 'mongodb', 'aws', 'azure', 'docker', 'kubernetes',
+    'tensorflow', 'pytorch', 'pandas', 'numpy', 'git', 'jenkins', 'jira'
+    # ... (your existing list)
+})
+
+_KNOWN_SKILLS_RE = compile_vocab_re(_KNOWN_SKILLS)
+
+# Common non-skill words to filter out
+_STOPWORDS = frozenset({
+    'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
+    'from', 'up', 'about', 'into', 'through', 'during', 'before', 'after', 'above',
+    'below', 'between', 'among',
+    'team', 'work', 'working', 'ability', 'strong', 'excellent', 'good', 'experience',
+    'years', 'year', 'must', 'should', 'required', 'preferred', 'desired', 'knowledge',
+    'skills', 'skill', 'understanding', 'familiar', 'background', 'expertise'
+})
+
+# Common English words that look like skills but are not
+_GENERIC_WORDS = frozenset({'team', 'work', 'project', 'company', 'role', 'position', 'job'})
 
 class ComprehensiveSkillExtractor:
     def __init__(self):
         # Load lightweight spaCy model for NLP
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            print("Please install: python -m spacy download en_core_web_sm")
-            self.nlp = None
+        self.nlp = load_nlp()
         
         # Predefined technical skills (for ultra-fast extraction)
-        self.known_skills = {
-            'python', 'java', 'javascript', 'react', 'angular', 'vue.js', 'node.js',
-            'mysql', 'postgresql', 'mongodb', 'aws', 'azure', 'docker', 'kubernetes',
-            'tensorflow', 'pytorch', 'pandas', 'numpy', 'git', 'jenkins', 'jira'
-            # ... (your existing list)
-        }
+        self.known_skills = _KNOWN_SKILLS
+        self.known_skills_re = _KNOWN_SKILLS_RE
         
         # Skill indicators - patterns that suggest something is a skill
         self.skill_indicators = {
@@ -217,10 +232,16 @@ class ComprehensiveSkillExtractor:
                 r'\s+(?:required|preferred|desired|mandatory|essential|necessary)',
                 r'\s+(?:developer|engineer|specialist|expert|administrator|analyst|architect|consultant)'
             ],
-            'patterns': [
+            # Terms whose matches can overlap the tokens below (e.g. Spring-Boot vs Spring, Boot),
+            # so each keeps its own sweep
+            'overlapping_patterns': [
+                r'\b\w+[-_]\w+\b',  # Hyphenated/underscore terms (e.g., test-driven, machine_learning)
+            ],
+            # Whole, word-bounded tokens that never overlap each other, so one alternation
+            # finds exactly what separate sweeps would
+            'token_patterns': [
                 r'\b[A-Z][a-z]+(?:\.[a-z]+)*\b',  # CamelCase or dotted notation (e.g., React.js, Node.js)
                 r'\b[A-Z]{2,}\b',  # Acronyms (e.g., API, REST, JSON)
-                r'\b\w+[-_]\w+\b',  # Hyphenated/underscore terms (e.g., test-driven, machine_learning)
                 r'\b\d+\.\d+\b'  # Version numbers (e.g., Python 3.9)
             ]
         }
@@ -229,27 +250,19 @@ class ComprehensiveSkillExtractor:
         self.compiled_patterns = {
             'before': [re.compile(pattern, re.IGNORECASE) for pattern in self.skill_indicators['before']],
             'after': [re.compile(pattern, re.IGNORECASE) for pattern in self.skill_indicators['after']],
-            'patterns': [re.compile(pattern) for pattern in self.skill_indicators['patterns']]
+            'overlapping_patterns': [re.compile(pattern) for pattern in self.skill_indicators['overlapping_patterns']],
+            'token_patterns': re.compile('|'.join(f'(?:{pattern})' for pattern in self.skill_indicators['token_patterns']))
         }
         
         # Common non-skill words to filter out
-        self.stopwords = {
-            'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
-            'from', 'up', 'about', 'into', 'through', 'during', 'before', 'after', 'above',
-            'below', 'between', 'among', 'through', 'during', 'before', 'after', 'above',
-            'team', 'work', 'working', 'ability', 'strong', 'excellent', 'good', 'experience',
-            'years', 'year', 'must', 'should', 'required', 'preferred', 'desired', 'knowledge',
-            'skills', 'skill', 'understanding', 'familiar', 'background', 'expertise'
-        }
+        self.stopwords = _STOPWORDS
 
     def _extract_predefined_skills(self, text: str) -> Set[str]:
         """Ultra-fast extraction of known skills"""
         found_skills = set()
         text_lower = text.lower()
         
-        for skill in self.known_skills:
-            if re.search(rf'\b{re.escape(skill)}\b', text_lower):
-                found_skills.add(skill)
+        found_skills.update(self.known_skills_re.findall(text_lower))
         
         return found_skills
 
@@ -279,9 +292,8 @@ class ComprehensiveSkillExtractor:
         found_skills = set()
         
         # Extract technology-like patterns
-        for pattern in self.compiled_patterns['patterns']:
-            matches = pattern.finditer(text)
-            for match in matches:
+        for pattern in (*self.compiled_patterns['overlapping_patterns'], self.compiled_patterns['token_patterns']):
+            for match in pattern.finditer(text):
                 potential_skill = match.group(0)
                 if self._is_valid_skill(potential_skill):
                     found_skills.add(potential_skill.lower())
@@ -320,7 +332,7 @@ class ComprehensiveSkillExtractor:
             return False
         
         # Filter out common English words
-        if term in ['team', 'work', 'project', 'company', 'role', 'position', 'job']:
+        if term in _GENERIC_WORDS:
             return False
         
         # Must contain at least one letter
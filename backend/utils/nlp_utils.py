@@ -0,0 +1,30 @@
+import re
+
+_nlp = None
+
+
+def load_nlp():
+    """Shared en_core_web_sm pipeline, loaded on first use.
+
+    Returns None while the model is not installed; the load is retried on the
+    next call, so installing the model does not require a restart.
+    """
+    global _nlp
+    if _nlp is None:
+        import spacy
+        try:
+            _nlp = spacy.load("en_core_web_sm")
+        except OSError:
+            print("Please install: python -m spacy download en_core_web_sm")
+    return _nlp
+
+
+def compile_vocab_re(vocab: frozenset) -> re.Pattern:
+    """One word-bounded alternation over a lowercase vocabulary.
+
+    Terms are tried longest first so 'node.js' wins over 'node', and a single
+    finditer pass over the text replaces one substring test per term.
+    """
+    return re.compile(
+        r'\b(?:' + '|'.join(re.escape(s) for s in sorted(vocab, key=len, reverse=True)) + r')\b'
+    )
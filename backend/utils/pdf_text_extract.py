@@ -1,12 +1,8 @@
-from pypdf import PdfReader
+import pymupdf
 
-reader = PdfReader("test pdfs/Jay Singh Resume AI-ML-DS.pdf")
-text_all = ""
-for page in reader.pages:
-    text_all+=page.extract_text()
+with pymupdf.open("test pdfs/Jay Singh Resume AI-ML-DS.pdf") as doc:
+    text_all = "".join(page.get_text("text") for page in doc)
     
 
 with open("test pdfs/resume_text.txt", 'w', encoding='utf-8') as file:
     file.write(text_all)
-
-
@@ -380,31 +380,123 @@
 
 
 import re
-import spacy
 from datetime import datetime, date
 from dateutil.relativedelta import relativedelta
 import dateutil.parser as date_parser
 from typing import List, Dict, Set, Tuple, Optional
 import warnings
 from collections import defaultdict, Counter
+from functools import lru_cache
+from utils.nlp_utils import load_nlp, compile_vocab_re
+
+# Patterns are compiled once at import instead of being looked up on every call
+_DATE_CLEAN_RE = re.compile(r'[^\w\s/-]')
+
+_DATE_PATTERNS = [
+    re.compile(r'(\w+)\s+(\d{4})'),  # Month Year
+    re.compile(r'(\d{1,2})[/-](\d{4})'),  # MM/YYYY
+    re.compile(r'(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})'),  # MM/DD/YYYY
+    re.compile(r'(\d{4})'),  # Just year
+]
+
+# Pattern: Job Title | Company | Date Range
+# Pattern: Job Title at Company (Date Range)
+# Pattern: Job Title - Company - Date Range
+_JOB_LINE_PATTERNS = [
+    re.compile(r'(.+?)\s*[\|@]\s*(.+?)\s*[\|@-]\s*(.+)', re.IGNORECASE),
+    re.compile(r'(.+?)\s+at\s+(.+?)\s*[\(\[](.+?)[\)\]]', re.IGNORECASE),
+    re.compile(r'(.+?)\s*-\s*(.+?)\s*-\s*(.+)', re.IGNORECASE),
+    re.compile(r'(.+?)\s*,\s*(.+?)\s*[\(\[](.+?)[\)\]]', re.IGNORECASE),
+]
+
+_DATE_RANGE_SPLIT_RE = re.compile(r'\s*(?:to|[-–])\s*')
+
+_STATED_EXPERIENCE_PATTERNS = [
+    re.compile(r'(?:total|overall)\s+(?:experience|exp)[\s:]*(\d+(?:\.\d+)?)\s*(?:\+)?\s*years?', re.IGNORECASE),
+    re.compile(r'(\d+(?:\.\d+)?)\s*(?:\+)?\s*years?\s+(?:of\s+)?(?:total|overall|professional)\s+(?:experience|exp)', re.IGNORECASE),
+    re.compile(r'(?:experience|exp)[\s:]*(\d+(?:\.\d+)?)\s*(?:\+)?\s*years?', re.IGNORECASE),
+    re.compile(r'(\d+(?:\.\d+)?)\s*(?:\+)?\s*years?\s+(?:experience|exp)', re.IGNORECASE),
+]
+
+_SKILL_CONTEXT_PATTERNS = [
+    re.compile(r'(?:skills?|technologies?|tools?|frameworks?|languages?)[:\-]?\s*([^.]{1,200})', re.IGNORECASE),
+    re.compile(r'(?:proficient|experienced|expertise|familiar)\s+(?:with|in)\s+([^.]{1,100})', re.IGNORECASE),
+    re.compile(r'(?:knowledge|experience)\s+(?:of|in|with)\s+([^.]{1,100})', re.IGNORECASE),
+]
+
+_SKILL_TOKEN_RE = re.compile(r'\b[a-z]+(?:\.[a-z]+)*\b')
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Month name mapping
+_MONTH_MAPPING = {
+    'january': '01', 'jan': '01', 'february': '02', 'feb': '02',
+    'march': '03', 'mar': '03', 'april': '04', 'apr': '04',
+    'may': '05', 'june': '06', 'jun': '06', 'july': '07', 'jul': '07',
+    'august': '08', 'aug': '08', 'september': '09', 'sep': '09',
+    'october': '10', 'oct': '10', 'november': '11', 'nov': '11',
+    'december': '12', 'dec': '12'
+}
+
+@lru_cache(maxsize=16384)
+def _parse_date_cached(date_str: str) -> Optional[date]:
+    """Parse a normalized date fragment with the explicit formats; None if none of them fit"""
+    # Try various date formats
+    for pattern in _DATE_PATTERNS:
+        match = pattern.search(date_str)
+        if match:
+            try:
+                if len(match.groups()) == 2:
+                    part1, part2 = match.groups()
+                    # Check if first part is month name
+                    if part1 in _MONTH_MAPPING:
+                        month = _MONTH_MAPPING[part1]
+                        year = int(part2)
+                        return date(year, int(month), 1)
+                    else:
+                        # Assume MM/YYYY format
+                        return date(int(part2), int(part1), 1)
+                elif len(match.groups()) == 3:
+                    # MM/DD/YYYY format
+                    month, day, year = match.groups()
+                    year = int(year)
+                    if year < 50:
+                        year += 2000
+                    elif year < 100:
+                        year += 1900
+                    return date(year, int(month), int(day))
+                else:
+                    # Just year
+                    year = int(match.group(1))
+                    return date(year, 1, 1)
+            except:
+                continue
+    
+    return None
+
+def _parse_date_fuzzy(date_str: str) -> Optional[date]:
+    """dateutil fallback; not cached because missing fields are filled in from today's date"""
+    try:
+        parsed = date_parser.parse(date_str, fuzzy=True)
+        return parsed.date()
+    except:
+        return None
+
+# Technical skills database
+_TECHNICAL_SKILLS = frozenset({
+    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust',
+    'react', 'angular', 'vue', 'node.js', 'django', 'flask', 'spring',
+    'mysql', 'postgresql', 'mongodb', 'redis', 'aws', 'azure', 'docker',
+    'kubernetes', 'jenkins', 'git', 'tensorflow', 'pytorch', 'pandas'
+})
+
+_TECHNICAL_SKILLS_RE = compile_vocab_re(_TECHNICAL_SKILLS)
 
 class AccurateResumeParser:
     def __init__(self):
-        # Load spaCy model
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            import subprocess
-            subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"])
-            self.nlp = spacy.load("en_core_web_sm")
-        
         # Technical skills database
-        self.technical_skills = {
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust',
-            'react', 'angular', 'vue', 'node.js', 'django', 'flask', 'spring',
-            'mysql', 'postgresql', 'mongodb', 'redis', 'aws', 'azure', 'docker',
-            'kubernetes', 'jenkins', 'git', 'tensorflow', 'pytorch', 'pandas'
-        }
+        self.technical_skills = _TECHNICAL_SKILLS
+        self.technical_skills_re = _TECHNICAL_SKILLS_RE
         
         # Experience section keywords
         self.experience_keywords = [
@@ -422,14 +514,12 @@ class AccurateResumeParser:
         ]
         
         # Month name mapping
-        self.month_mapping = {
-            'january': '01', 'jan': '01', 'february': '02', 'feb': '02',
-            'march': '03', 'mar': '03', 'april': '04', 'apr': '04',
-            'may': '05', 'june': '06', 'jun': '06', 'july': '07', 'jul': '07',
-            'august': '08', 'aug': '08', 'september': '09', 'sep': '09',
-            'october': '10', 'oct': '10', 'november': '11', 'nov': '11',
-            'december': '12', 'dec': '12'
-        }
+        self.month_mapping = _MONTH_MAPPING
+    
+    @property
+    def nlp(self):
+        """Shared spaCy pipeline, loaded on first use"""
+        return load_nlp()
     
     def extract_experience_section(self, resume_text: str) -> str:
         """Extract the experience section from resume"""
@@ -467,53 +557,15 @@ class AccurateResumeParser:
         if any(word in date_str for word in ['present', 'current', 'now', 'ongoing']):
             return date.today()
         
-        # Clean the date string
-        date_str = re.sub(r'[^\w\s/-]', '', date_str)
-        
-        # Try various date formats
-        date_patterns = [
-            r'(\w+)\s+(\d{4})',  # Month Year
-            r'(\d{1,2})[/-](\d{4})',  # MM/YYYY
-            r'(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})',  # MM/DD/YYYY
-            r'(\d{4})',  # Just year
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, date_str)
-            if match:
-                try:
-                    if len(match.groups()) == 2:
-                        part1, part2 = match.groups()
-                        # Check if first part is month name
-                        if part1 in self.month_mapping:
-                            month = self.month_mapping[part1]
-                            year = int(part2)
-                            return date(year, int(month), 1)
-                        else:
-                            # Assume MM/YYYY format
-                            return date(int(part2), int(part1), 1)
-                    elif len(match.groups()) == 3:
-                        # MM/DD/YYYY format
-                        month, day, year = match.groups()
-                        year = int(year)
-                        if year < 50:
-                            year += 2000
-                        elif year < 100:
-                            year += 1900
-                        return date(year, int(month), int(day))
-                    else:
-                        # Just year
-                        year = int(match.group(1))
-                        return date(year, 1, 1)
-                except:
-                    continue
+        # Clean the date string and collapse runs of whitespace so equivalent
+        # fragments share a cache entry
+        date_str = _WHITESPACE_RE.sub(' ', _DATE_CLEAN_RE.sub('', date_str)).strip()
         
-        # Fallback to dateutil parser
-        try:
-            parsed = date_parser.parse(date_str, fuzzy=True)
-            return parsed.date()
-        except:
-            return None
+        parsed = _parse_date_cached(date_str)
+        if parsed is None:
+            # Fallback to dateutil parser
+            parsed = _parse_date_fuzzy(date_str)
+        return parsed
     
     def extract_job_entries(self, experience_text: str) -> List[Dict]:
         """Extract individual job entries with better accuracy"""
@@ -529,20 +581,9 @@ class AccurateResumeParser:
                 continue
             
             # Check if this line contains a job title and company
-            # Pattern: Job Title | Company | Date Range
-            # Pattern: Job Title at Company (Date Range)
-            # Pattern: Job Title - Company - Date Range
-            
-            job_patterns = [
-                r'(.+?)\s*[\|@]\s*(.+?)\s*[\|@-]\s*(.+)',
-                r'(.+?)\s+at\s+(.+?)\s*[\(\[](.+?)[\)\]]',
-                r'(.+?)\s*-\s*(.+?)\s*-\s*(.+)',
-                r'(.+?)\s*,\s*(.+?)\s*[\(\[](.+?)[\)\]]'
-            ]
-            
             job_match = None
-            for pattern in job_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
+            for pattern in _JOB_LINE_PATTERNS:
+                match = pattern.search(line)
                 if match:
                     job_match = match
                     break
@@ -553,7 +594,7 @@ class AccurateResumeParser:
                 date_range = job_match.group(3).strip()
                 
                 # Extract start and end dates
-                date_parts = re.split(r'\s*(?:to|[-–])\s*', date_range, maxsplit=1)
+                date_parts = _DATE_RANGE_SPLIT_RE.split(date_range, maxsplit=1)
                 
                 if len(date_parts) == 2:
                     start_date = self.parse_date_flexible(date_parts[0])
@@ -612,16 +653,11 @@ class AccurateResumeParser:
             start = job['start_date']
             end = job['end_date']
             
-            # Check for overlaps with existing periods
-            overlapping = False
-            for i, period in enumerate(merged_periods):
-                if start <= period[1] and end >= period[0]:
-                    # Merge overlapping periods
-                    merged_periods[i] = (min(start, period[0]), max(end, period[1]))
-                    overlapping = True
-                    break
-            
-            if not overlapping:
+            # Jobs are sorted by start date, so only the last merged period can overlap
+            if merged_periods and start <= merged_periods[-1][1]:
+                last_start, last_end = merged_periods[-1]
+                merged_periods[-1] = (last_start, max(end, last_end))
+            else:
                 merged_periods.append((start, end))
         
         # Recalculate total from merged periods
@@ -645,16 +681,9 @@ class AccurateResumeParser:
     
     def extract_stated_experience(self, resume_text: str) -> Optional[float]:
         """Extract explicitly stated total experience"""
-        patterns = [
-            r'(?:total|overall)\s+(?:experience|exp)[\s:]*(\d+(?:\.\d+)?)\s*(?:\+)?\s*years?',
-            r'(\d+(?:\.\d+)?)\s*(?:\+)?\s*years?\s+(?:of\s+)?(?:total|overall|professional)\s+(?:experience|exp)',
-            r'(?:experience|exp)[\s:]*(\d+(?:\.\d+)?)\s*(?:\+)?\s*years?',
-            r'(\d+(?:\.\d+)?)\s*(?:\+)?\s*years?\s+(?:experience|exp)'
-        ]
-        
         max_stated = 0
-        for pattern in patterns:
-            matches = re.finditer(pattern, resume_text, re.IGNORECASE)
+        for pattern in _STATED_EXPERIENCE_PATTERNS:
+            matches = pattern.finditer(resume_text)
             for match in matches:
                 try:
                     years = float(match.group(1))
@@ -670,22 +699,14 @@ class AccurateResumeParser:
         text_lower = resume_text.lower()
         
         # Direct skill matching
-        for skill in self.technical_skills:
-            if re.search(rf'\b{re.escape(skill)}\b', text_lower):
-                found_skills.add(skill)
+        found_skills.update(self.technical_skills_re.findall(text_lower))
         
         # Context-based extraction
-        skill_contexts = [
-            r'(?:skills?|technologies?|tools?|frameworks?|languages?)[:\-]?\s*([^.]{1,200})',
-            r'(?:proficient|experienced|expertise|familiar)\s+(?:with|in)\s+([^.]{1,100})',
-            r'(?:knowledge|experience)\s+(?:of|in|with)\s+([^.]{1,100})'
-        ]
-        
-        for pattern in skill_contexts:
-            matches = re.finditer(pattern, text_lower, re.IGNORECASE)
+        for pattern in _SKILL_CONTEXT_PATTERNS:
+            matches = pattern.finditer(text_lower)
             for match in matches:
                 context = match.group(1)
-                potential_skills = re.findall(r'\b[a-z]+(?:\.[a-z]+)*\b', context)
+                potential_skills = _SKILL_TOKEN_RE.findall(context)
                 for skill in potential_skills:
                     if skill in self.technical_skills:
                         found_skills.add(skill)
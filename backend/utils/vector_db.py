@@ -1,16 +1,132 @@
 from sentence_transformers import SentenceTransformer, util
+from functools import lru_cache
 import asyncio
+import torch
+
+device = 'cuda' if torch.cuda.is_available() else 'cpu'
+
+if device == 'cuda':
+    # FP16 PyTorch weights on the GPU
+    model = SentenceTransformer('all-MiniLM-L6-v2', device=device)
+    model.half()
+else:
+    # Dynamically INT8-quantized ONNX export shipped with the model repo, served by ONNX Runtime on CPU
+    model = SentenceTransformer(
+        'all-MiniLM-L6-v2',
+        backend='onnx',
+        model_kwargs={'file_name': 'onnx/model_quint8_avx2.onnx', 'provider': 'CPUExecutionProvider'},
+    )
+
+# Only short skill phrases are encoded; truncate at 32 tokens instead of the default 256.
+# encode already pads each batch to its longest input, so this just bounds the worst case.
+model.max_seq_length = 32
+
+
+def _encode(texts: list):
+    # inference_mode is thread-local, so it is entered here, inside the worker thread
+    with torch.inference_mode():
+        return model.encode(texts, convert_to_tensor=True, normalize_embeddings=True, batch_size=128)
+
+
+@lru_cache(maxsize=256)
+def _encode_corpus(corpus: tuple):
+    """Normalized corpus embeddings on the model's device, memoized per corpus (call cache_clear() if `model` is swapped)"""
+    return _encode(list(corpus))
+
+
+class EncodeBatcher:
+    """Coalesces query encodes from concurrent requests into a single model.encode call"""
+
+    def __init__(self, max_batch: int = 64, max_wait_ms: float = 5):
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue = None
+        self._worker = None
+
+    async def encode(self, texts: list):
+        """Normalized embeddings for `texts`, encoded together with whatever else is queued"""
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._worker.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._drain())
+        future = loop.create_future()
+        await self._queue.put((texts, future))
+        return await future
+
+    async def _drain(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = [await self._queue.get()]
+            size = len(pending[0][0])
+            deadline = loop.time() + self.max_wait
+            # Keep collecting until the batch is full or the wait window closes
+            while size < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                pending.append(item)
+                size += len(item[0])
+
+            texts = [text for batch, _ in pending for text in batch]
+            try:
+                emb = await asyncio.to_thread(_encode, texts)
+            except Exception:
+                # Re-encode each request on its own so one bad input only fails its own caller
+                for batch, future in pending:
+                    try:
+                        result = await asyncio.to_thread(_encode, batch)
+                    except Exception as exc:
+                        if not future.done():
+                            future.set_exception(exc)
+                    else:
+                        if not future.done():
+                            future.set_result(result)
+                continue
+
+            offset = 0
+            for batch, future in pending:
+                if not future.done():
+                    future.set_result(emb[offset:offset + len(batch)])
+                offset += len(batch)
+
+
+encode_batcher = EncodeBatcher()
 
-model = SentenceTransformer('all-MiniLM-L6-v2')
 
 class VectorDB:
+    query_chunk = 512
+
     async def similarity_search(self, query: str, corpus: list, top_k: int = 1):
-        q_emb = model.encode(query, convert_to_tensor=True)
-        c_emb = model.encode(corpus, convert_to_tensor=True)
-        hits = util.semantic_search(q_emb, c_emb, top_k=top_k)[0]
-        return [corpus[h['corpus_id']] for h in hits if h['score']>0.7]
+        if not corpus:
+            return []
+        # Embeddings come back normalized, so a dot product is the cosine score
+        q_emb = await encode_batcher.encode([query])
+        c_emb = await asyncio.to_thread(_encode_corpus, tuple(corpus))
+        scores = util.dot_score(q_emb, c_emb)[0]
+        top = torch.topk(scores, k=min(top_k, len(corpus)))
+        return [corpus[i] for s, i in zip(top.values.tolist(), top.indices.tolist()) if s>0.7]
         # return hits
-    
+
+    async def batch_match(self, queries: list, corpus: list, threshold: float = 0.7) -> list:
+        """Best corpus entry for every query (None when below threshold), in one encode per side"""
+        if not queries or not corpus:
+            return [None] * len(queries)
+        q_emb = await encode_batcher.encode(queries)
+        c_emb = await asyncio.to_thread(_encode_corpus, tuple(corpus))
+        matches = [None] * len(queries)
+        # Score the queries in tiles so peak memory is chunk x corpus rather than queries x corpus
+        for start in range(0, len(queries), self.query_chunk):
+            scores = util.dot_score(q_emb[start:start + self.query_chunk], c_emb)
+            best_scores, best_idx = scores.max(dim=1)
+            for offset, (s, i) in enumerate(zip(best_scores.tolist(), best_idx.tolist())):
+                if s > threshold:
+                    matches[start + offset] = corpus[i]
+        return matches
+
     
     
 # vector_db = VectorDB()
@@ -1,13 +1,15 @@
 import pymupdf  # Instead of: import fitz
 
 def extract_text_from_file(uploaded_file):
+    # getvalue() rather than read(): Streamlit hands back the same buffer on every rerun
+    file_bytes = uploaded_file.getvalue()
     if uploaded_file.type == "application/pdf":
-        pdf_bytes = uploaded_file.read()
-        doc = pymupdf.open(stream=pdf_bytes, filetype="pdf")
-        text = ""
-        
-        for page in doc:
-            text += page.get_text() + "\n"  # Now recognized by Pylance
-        
-        doc.close()
-        return text.strip()
+        # Open the document once and collect page text in a single pass.
+        # Pages are read serially on purpose: PyMuPDF is not thread-safe and
+        # holds the GIL in get_text, so a thread pool would not speed this up.
+        with pymupdf.open(stream=file_bytes, filetype="pdf") as doc:
+            pages = [page.get_text("text") for page in doc]
+
+        return "\n".join(pages).strip()
+
+    return file_bytes.decode("utf-8", errors="ignore").strip()
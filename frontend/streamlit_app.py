@@ -627,7 +627,7 @@ import streamlit as st
 import httpx
 import logging
 import time
-from pypdf import PdfReader
+from resume_pdf_to_text import extract_text_from_file
 
 logging.basicConfig(level=logging.ERROR, filename='app.log', format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -810,8 +810,7 @@ try:
         resume_file = st.file_uploader("Upload Resume (txt/pdf)")
 
         if resume_file:
-            page = PdfReader(resume_file).pages[0]
-            st.session_state.resume_text = page.extract_text()
+            st.session_state.resume_text = extract_text_from_file(resume_file)
 
         st.session_state.jd_text = jd_input
 
@@ -1,18 +1,15 @@
 # importing required modules
-from pypdf import PdfReader
+import pymupdf
 
-# creating a pdf reader object
-reader = PdfReader("test pdfs\\New Resume with Projects.pdf")
+# opening the pdf document
+with pymupdf.open("test pdfs\\New Resume with Projects.pdf") as doc:
+    # printing number of pages in pdf file
+    print(doc.page_count)
 
-# printing number of pages in pdf file
-print(len(reader.pages))
+    # extracting text from the first page
+    text = doc[0].get_text("text")
 
-# getting a specific page from the pdf file
-page = reader.pages[0]
-
-# extracting text from page
-text = page.extract_text()
 with open('test.txt', 'w', encoding="utf-8") as file:
     file.write(text)
     
-print(text)
\ No newline at end of file
+print(text)